@@ -1,5 +1,17 @@
 from django.contrib import admin
-from .models import Student, Course, Grade
+from .models import Student, Course, Enrollment, Grade
+
+
+class EnrollmentInline(admin.TabularInline):
+    """
+    Inline editor for a student's course enrollments.
+    Needed because admin hides M2M fields that use an explicit through model.
+    """
+    model = Enrollment
+    extra = 1
+    
+    # Search courses via AJAX instead of rendering every course in the form
+    autocomplete_fields = ['course']
 
 
 @admin.register(Student)  # Decorator to register Student model with admin
@@ -14,11 +26,18 @@ class StudentAdmin(admin.ModelAdmin):
     # Filter options in right sidebar for quick filtering
     list_filter = ['year', 'created_at']
     
-    # Fields that can be searched using the search box
-    search_fields = ['student_id', 'first_name', 'last_name', 'email']
+    # Fields that can be searched using the search box. Prefix matches (^) let
+    # the database use the column indexes instead of scanning with LIKE '%q%'
+    search_fields = ['^student_id', '^first_name', '^last_name', '^email']
+    
+    # Skip the extra unfiltered COUNT(*) the changelist runs for search results
+    show_full_result_count = False
     
     # Default ordering of records in admin list view
     ordering = ['student_id']
+    
+    # Manage enrollments inline (courses use a through model)
+    inlines = [EnrollmentInline]
 
 
 @admin.register(Course)  # Register Course model with custom admin
@@ -34,6 +53,23 @@ class CourseAdmin(admin.ModelAdmin):
     search_fields = ['code', 'name']
 
 
+class GradeLetterFilter(admin.SimpleListFilter):
+    """
+    Sidebar filter for letter grades.
+    Options come from Grade.GRADE_CHOICES, so no query is needed to build them.
+    """
+    title = 'grade'
+    parameter_name = 'grade'
+    
+    def lookups(self, request, model_admin):
+        return Grade.GRADE_CHOICES
+    
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(grade=self.value())
+        return queryset
+
+
 @admin.register(Grade)  # Register Grade model with admin interface
 class GradeAdmin(admin.ModelAdmin):
     """
@@ -44,4 +80,14 @@ class GradeAdmin(admin.ModelAdmin):
     list_display = ['student', 'course', 'grade', 'marks']
     
     # Filter by grade letters for quick grade analysis
-    list_filter = ['grade']
+    list_filter = [GradeLetterFilter]
+    
+    # Pick student and course through lookup popups instead of loading every row into a dropdown
+    raw_id_fields = ['student', 'course']
+    
+    # Fetch student and course in the same query as the grades (avoids N+1)
+    list_select_related = ['student', 'course']
+    
+    def get_queryset(self, request):
+        """Join related student and course for every admin view, not just the list."""
+        return super().get_queryset(request).select_related('student', 'course')
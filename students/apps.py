@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class StudentsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "students"
+
+    def ready(self):
+        # Register signal handlers (cache invalidation)
+        from . import signals  # noqa: F401
@@ -1,7 +1,13 @@
+import copy
+import csv
+import io
+
 from django import forms
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import User
-from .models import Student, Course, Grade
+from django.db import transaction
+from .models import Student, Course, Enrollment, Grade
+from .signals import clear_course_list_cache
 
 
 class StudentForm(forms.ModelForm):
@@ -22,6 +28,42 @@ class StudentForm(forms.ModelForm):
             'year': forms.Select(attrs={'class': 'form-control'}),
             'courses': forms.CheckboxSelectMultiple(),  # Allow multiple course selection
         }
+    
+    def __init__(self, *args, **kwargs):
+        """Load only the course columns the checkbox labels display."""
+        super().__init__(*args, **kwargs)
+        self.fields['courses'].queryset = Course.objects.only('id', 'code', 'name').order_by('code')
+    
+    def save(self, commit=True):
+        """Save the student, syncing course enrollments through _save_enrollments()."""
+        student = super().save(commit=False)
+        self.save_m2m = self._save_enrollments
+        if commit:
+            student.save()
+            self._save_enrollments()
+        return student
+    
+    def _save_enrollments(self):
+        """
+        Diff selected courses against current enrollments so the change is
+        applied with one bulk INSERT and one DELETE at most.
+        """
+        student = self.instance
+        selected = {course.pk for course in self.cleaned_data['courses']}
+        current = set(Enrollment.objects.filter(student=student).values_list('course_id', flat=True))
+        
+        to_add = selected - current
+        if to_add:
+            Enrollment.objects.bulk_create(
+                [Enrollment(student=student, course_id=course_id) for course_id in to_add],
+                ignore_conflicts=True,
+            )
+            # bulk_create() sends no post_save signals, so clear the cached course
+            # table here, once the transaction commits (deletes below send signals)
+            transaction.on_commit(clear_course_list_cache)
+        to_remove = current - selected
+        if to_remove:
+            Enrollment.objects.filter(student=student, course_id__in=to_remove).delete()
 
 
 class CourseForm(forms.ModelForm):
@@ -48,17 +90,65 @@ class GradeForm(forms.ModelForm):
     """
     class Meta:
         model = Grade
-        fields = ['student', 'course', 'grade', 'marks']
+        fields = ['student', 'course', 'marks']  # Letter grade is derived from marks
         
         # Form widgets with validation constraints
         widgets = {
             'student': forms.Select(attrs={'class': 'form-control'}),
             'course': forms.Select(attrs={'class': 'form-control'}),
-            'grade': forms.Select(attrs={'class': 'form-control'}),
             'marks': forms.NumberInput(attrs={'class': 'form-control', 'min': 0, 'max': 100}),
         }
 
 
+class GradeImportForm(forms.Form):
+    """
+    Upload form for assigning many grades at once from a CSV file.
+    Each row holds: student_id, course_code, marks (header row optional).
+    """
+    csv_file = forms.FileField(
+        widget=forms.ClearableFileInput(attrs={'class': 'form-control', 'accept': '.csv'})
+    )
+    
+    def clean_csv_file(self):
+        """Parse and validate the uploaded CSV, returning a list of row tuples."""
+        try:
+            text = self.cleaned_data['csv_file'].read().decode('utf-8-sig')
+        except UnicodeDecodeError:
+            raise forms.ValidationError('File must be UTF-8 encoded CSV.')
+        
+        rows = []
+        for line_number, row in enumerate(csv.reader(io.StringIO(text)), start=1):
+            row = [value.strip() for value in row]
+            if not any(row):
+                continue  # Skip blank lines
+            if line_number == 1 and row[0].lower() == 'student_id':
+                continue  # Skip header row
+            if len(row) != 3:
+                raise forms.ValidationError(f'Line {line_number}: expected 3 columns, got {len(row)}.')
+            student_id, course_code, marks = row
+            # isdecimal() (not isdigit()) so characters like '²' are rejected before int()
+            if not marks.isdecimal() or int(marks) > 100:
+                raise forms.ValidationError(f'Line {line_number}: marks must be between 0 and 100.')
+            rows.append((student_id, course_code, int(marks)))
+        
+        if not rows:
+            raise forms.ValidationError('The file contains no grade rows.')
+        return rows
+
+
+def _with_bootstrap_widgets(form_class):
+    """
+    Class decorator adding the Bootstrap 'form-control' class to every field
+    widget once at import time, instead of looping over fields on each request.
+    Fields are copied first so inherited fields on the parent form stay untouched.
+    """
+    form_class.base_fields = copy.deepcopy(form_class.base_fields)
+    for field in form_class.base_fields.values():
+        field.widget.attrs.update({'class': 'form-control'})
+    return form_class
+
+
+@_with_bootstrap_widgets  # Apply Bootstrap styling to all form fields
 class UserRegisterForm(UserCreationForm):
     """
     Extended user registration form with email field.
@@ -70,10 +160,3 @@ class UserRegisterForm(UserCreationForm):
     class Meta:
         model = User
         fields = ['username', 'email', 'password1', 'password2']
-        
-    def __init__(self, *args, **kwargs):
-        """Apply Bootstrap styling to all form fields."""
-        super().__init__(*args, **kwargs)
-        # Loop through all fields and add Bootstrap classes
-        for field in self.fields:
-            self.fields[field].widget.attrs.update({'class': 'form-control'})
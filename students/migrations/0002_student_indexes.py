@@ -0,0 +1,30 @@
+# Generated by Django 5.2.4 on 2026-10-15 09:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("students", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="student",
+            index=models.Index(
+                fields=["last_name", "first_name"],
+                name="students_st_last_na_3e473b_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="student",
+            index=models.Index(fields=["year"], name="students_st_year_259ed9_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="student",
+            index=models.Index(
+                fields=["-created_at"], name="students_st_created_b34044_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-15 09:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("students", "0002_student_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="grade",
+            name="student",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="grades",
+                to="students.student",
+            ),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.4 on 2026-10-15 09:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("students", "0003_grade_student_related_name"),
+    ]
+
+    operations = [
+        # The implicit through table already has the right columns and unique
+        # constraint, so only the migration state changes here.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name="Enrollment",
+                    fields=[
+                        (
+                            "id",
+                            models.BigAutoField(
+                                auto_created=True,
+                                primary_key=True,
+                                serialize=False,
+                                verbose_name="ID",
+                            ),
+                        ),
+                        (
+                            "course",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                to="students.course",
+                            ),
+                        ),
+                        (
+                            "student",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE,
+                                to="students.student",
+                            ),
+                        ),
+                    ],
+                    options={
+                        "db_table": "students_student_courses",
+                        "unique_together": {("student", "course")},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name="student",
+                    name="courses",
+                    field=models.ManyToManyField(
+                        blank=True, through="students.Enrollment", to="students.course"
+                    ),
+                ),
+            ],
+        ),
+    ]
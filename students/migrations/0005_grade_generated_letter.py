@@ -0,0 +1,47 @@
+# Generated by Django 5.2.4 on 2026-10-15 09:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("students", "0004_enrollment"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="grade",
+            name="marks",
+            field=models.PositiveSmallIntegerField(),
+        ),
+        # Fields can't be altered into generated columns, so the stored letter
+        # grade is dropped and re-added as a column computed from marks.
+        migrations.RemoveField(
+            model_name="grade",
+            name="grade",
+        ),
+        migrations.AddField(
+            model_name="grade",
+            name="grade",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(marks__gte=90, then=models.Value("A")),
+                    models.When(marks__gte=80, then=models.Value("B")),
+                    models.When(marks__gte=70, then=models.Value("C")),
+                    models.When(marks__gte=60, then=models.Value("D")),
+                    default=models.Value("F"),
+                ),
+                output_field=models.CharField(max_length=1),
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="grade",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("marks__gte", 0), ("marks__lte", 100)),
+                name="grade_marks_range",
+                violation_error_message="Marks must be between 0 and 100.",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-15 09:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("students", "0005_grade_generated_letter"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="student",
+            index=models.Index(
+                fields=["first_name"], name="students_st_first_n_ae97bb_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.4 on 2026-10-15 09:44
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("students", "0006_student_first_name_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="grade",
+            name="marks",
+            field=models.PositiveSmallIntegerField(
+                validators=[django.core.validators.MaxValueValidator(100)]
+            ),
+        ),
+    ]
@@ -1,3 +1,4 @@
+from django.core.validators import MaxValueValidator
 from django.db import models
 from django.urls import reverse
 
@@ -42,8 +43,8 @@ class Student(models.Model):
     year = models.CharField(max_length=1, choices=YEAR_CHOICES)  # Current academic year
     
     # Relationships
-    # Many-to-Many: One student can enroll in multiple courses
-    courses = models.ManyToManyField(Course, blank=True)
+    # Many-to-Many: One student can enroll in multiple courses (via Enrollment)
+    courses = models.ManyToManyField(Course, through='Enrollment', blank=True)
     
     # Timestamps - automatically managed by Django for audit trail
     created_at = models.DateTimeField(auto_now_add=True)  # Set once on creation
@@ -63,6 +64,33 @@ class Student(models.Model):
     
     class Meta:
         ordering = ['student_id']  # Default ordering by student ID
+        # Indexes for columns used by list views, admin filters and search
+        # (student_id and email are already indexed through unique=True)
+        indexes = [
+            models.Index(fields=['last_name', 'first_name']),
+            models.Index(fields=['first_name']),  # Admin prefix search on first name
+            models.Index(fields=['year']),
+            models.Index(fields=['-created_at']),  # Dashboard "recent students"
+        ]
+
+
+class Enrollment(models.Model):
+    """
+    Explicit through model for the Student-Course Many-to-Many relationship.
+    Lets enrollments be added and removed with bulk queries.
+    """
+    student = models.ForeignKey(Student, on_delete=models.CASCADE)  # Enrolled student
+    course = models.ForeignKey(Course, on_delete=models.CASCADE)    # Course enrolled in
+    
+    def __str__(self):
+        # Uses raw FK ids so listing enrollments never triggers extra queries
+        return f"Student #{self.student_id} in course #{self.course_id}"
+    
+    class Meta:
+        # Reuse the table Django created for the original implicit through model
+        db_table = 'students_student_courses'
+        # Business rule: a student can only enroll in a course once
+        unique_together = ['student', 'course']
 
 
 class Grade(models.Model):
@@ -71,7 +99,7 @@ class Grade(models.Model):
     Implements one grade per student per course business rule.
     """
     # Foreign Key relationships with CASCADE delete for data integrity
-    student = models.ForeignKey(Student, on_delete=models.CASCADE)  # Student who received grade
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name='grades')  # Student who received grade
     course = models.ForeignKey(Course, on_delete=models.CASCADE)    # Course for which grade was given
     
     # Letter grade choices with score ranges for clarity
@@ -83,13 +111,42 @@ class Grade(models.Model):
         ('F', 'F (Below 60)'),
     ]
     
-    grade = models.CharField(max_length=1, choices=GRADE_CHOICES)  # Letter grade assigned
-    marks = models.IntegerField()  # Numerical marks out of 100
+    # Numerical marks out of 100 - the validator reports errors on the form field,
+    # the CHECK constraint below is the database-level backstop
+    marks = models.PositiveSmallIntegerField(validators=[MaxValueValidator(100)])
+    
+    # Letter grade derived from marks and stored by the database (generated column),
+    # so every insert path - forms, admin, bulk imports - gets a consistent grade
+    grade = models.GeneratedField(
+        expression=models.Case(
+            models.When(marks__gte=90, then=models.Value('A')),
+            models.When(marks__gte=80, then=models.Value('B')),
+            models.When(marks__gte=70, then=models.Value('C')),
+            models.When(marks__gte=60, then=models.Value('D')),
+            default=models.Value('F'),
+        ),
+        output_field=models.CharField(max_length=1),
+        db_persist=True,
+    )
     
     def __str__(self):
-        # Display format for admin and debugging
-        return f"{self.student.get_full_name()} - {self.course.name} - {self.grade}"
+        # Display format for admin and debugging. Related names are only used
+        # when already loaded (select_related/prefetch_related), otherwise fall
+        # back to raw FK ids so str() never triggers per-row queries
+        student = self.student.get_full_name() if Grade.student.is_cached(self) else f"Student #{self.student_id}"
+        course = self.course.name if Grade.course.is_cached(self) else f"Course #{self.course_id}"
+        # The generated grade only exists once the database has computed it
+        grade = '?' if self._state.adding else self.grade
+        return f"{student} - {course} - {grade}"
     
     class Meta:
         # Business rule: One grade per student per course to prevent duplicates
         unique_together = ['student', 'course']
+        constraints = [
+            # Marks are out of 100, enforced by the database itself
+            models.CheckConstraint(
+                condition=models.Q(marks__gte=0) & models.Q(marks__lte=100),
+                name='grade_marks_range',
+                violation_error_message='Marks must be between 0 and 100.',
+            ),
+        ]
@@ -0,0 +1,24 @@
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import Course, Enrollment
+
+
+def clear_course_list_cache():
+    """Drop the cached course table so new courses and enrollment counts show up."""
+    cache.delete(make_template_fragment_key('course_list_table'))
+
+
+@receiver([post_save, post_delete], sender=Course)
+@receiver([post_save, post_delete], sender=Enrollment)
+def course_list_changed(sender, **kwargs):
+    """
+    Clear the course table cache whenever a course or enrollment changes,
+    from any code path (views, admin, shell). Waits for the commit so a
+    concurrent request can't re-cache the old data in between.
+    Note: bulk_create() sends no signals, so StudentForm._save_enrollments()
+    clears the cache itself after bulk-creating enrollments.
+    """
+    transaction.on_commit(clear_course_list_cache)
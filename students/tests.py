@@ -1,3 +1,325 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from .forms import GradeForm, StudentForm
+from .models import Student, Course, Enrollment, Grade
+
+
+class GradeBulkCreateTests(TestCase):
+    """Tests for importing grades from a CSV file."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('teacher', password='pw')
+        cls.student = Student.objects.create(
+            student_id='STU001', first_name='Ada', last_name='Lovelace',
+            email='ada@example.com', year='1',
+        )
+        cls.cs101 = Course.objects.create(name='Computer Science', code='CS101')
+        cls.ma101 = Course.objects.create(name='Mathematics', code='MA101')
+        cls.ph101 = Course.objects.create(name='Physics', code='PH101')
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def post_csv(self, content):
+        """Upload the given CSV text to the import view, following the redirect."""
+        upload = SimpleUploadedFile('grades.csv', content.encode('utf-8'), content_type='text/csv')
+        return self.client.post(reverse('grade_import'), {'csv_file': upload}, follow=True)
+
+    def message_texts(self, response):
+        return [str(message) for message in response.context['messages']]
+
+    def test_imports_rows_and_skips_header(self):
+        response = self.post_csv('student_id,course_code,marks\nSTU001,CS101,92\nSTU001,MA101,75\n')
+
+        self.assertRedirects(response, reverse('student_list'))
+        self.assertEqual(self.message_texts(response), ['Imported 2 grade(s).'])
+        grades = dict(Grade.objects.values_list('course__code', 'grade'))
+        self.assertEqual(grades, {'CS101': 'A', 'MA101': 'C'})
+
+    def test_skips_unknown_student_and_course(self):
+        response = self.post_csv('STU001,CS101,92\nSTU999,CS101,80\nSTU001,XX999,80\n')
+
+        self.assertEqual(self.message_texts(response), [
+            'Imported 1 grade(s).',
+            'Skipped 2 row(s) with an unknown student ID or course code.',
+        ])
+        self.assertEqual(Grade.objects.count(), 1)
+
+    def test_skips_existing_and_repeated_pairs(self):
+        Grade.objects.create(student=self.student, course=self.ma101, marks=50)
+
+        response = self.post_csv('STU001,CS101,92\nSTU001,CS101,40\nSTU001,MA101,99\nSTU001,PH101,81\n')
+
+        self.assertEqual(self.message_texts(response), [
+            'Imported 2 grade(s).',
+            'Skipped 2 row(s) for grades that already exist or repeat in the file.',
+        ])
+        marks = dict(Grade.objects.values_list('course__code', 'marks'))
+        # First occurrence in the file wins; the existing grade is left unchanged
+        self.assertEqual(marks, {'CS101': 92, 'MA101': 50, 'PH101': 81})
+
+    def test_rejects_invalid_marks(self):
+        for marks in ['101', '-5', 'abc', '²']:
+            with self.subTest(marks=marks):
+                response = self.post_csv(f'STU001,CS101,{marks}\n')
+
+                self.assertEqual(response.status_code, 200)
+                self.assertFormError(
+                    response.context['form'], 'csv_file',
+                    'Line 1: marks must be between 0 and 100.',
+                )
+        self.assertFalse(Grade.objects.exists())
+
+    def test_rejects_wrong_column_count(self):
+        response = self.post_csv('STU001,CS101,A,92\n')
+
+        self.assertFormError(response.context['form'], 'csv_file', 'Line 1: expected 3 columns, got 4.')
+        self.assertFalse(Grade.objects.exists())
+
+
+class StudentListPaginationTests(TestCase):
+    """Tests for the cursor (keyset) pagination of the student list."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('teacher', password='pw')
+        Student.objects.bulk_create([
+            Student(
+                student_id=f'STU{number:03}', first_name=f'First{number}', last_name=f'Last{number}',
+                email=f'student{number}@example.com', year='1',
+            )
+            for number in range(1, 26)
+        ])
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def get_page(self, **params):
+        response = self.client.get(reverse('student_list'), params)
+        self.assertEqual(response.status_code, 200)
+        ids = [student.student_id for student in response.context['students']]
+        return ids, response.context['previous_cursor'], response.context['next_cursor']
+
+    def test_first_page(self):
+        ids, previous_cursor, next_cursor = self.get_page()
+
+        self.assertEqual(ids, [f'STU{number:03}' for number in range(1, 11)])
+        self.assertIsNone(previous_cursor)
+        self.assertEqual(next_cursor, 'STU010')
+
+    def test_after_cursor(self):
+        ids, previous_cursor, next_cursor = self.get_page(after='STU010')
+
+        self.assertEqual(ids, [f'STU{number:03}' for number in range(11, 21)])
+        self.assertEqual(previous_cursor, 'STU011')
+        self.assertEqual(next_cursor, 'STU020')
+
+    def test_last_page_has_no_next_cursor(self):
+        ids, previous_cursor, next_cursor = self.get_page(after='STU020')
+
+        self.assertEqual(ids, [f'STU{number:03}' for number in range(21, 26)])
+        self.assertEqual(previous_cursor, 'STU021')
+        self.assertIsNone(next_cursor)
+
+    def test_before_cursor(self):
+        ids, previous_cursor, next_cursor = self.get_page(before='STU021')
+
+        self.assertEqual(ids, [f'STU{number:03}' for number in range(11, 21)])
+        self.assertEqual(previous_cursor, 'STU011')
+        self.assertEqual(next_cursor, 'STU020')
+
+    def test_stale_after_cursor_falls_back_to_last_page(self):
+        ids, previous_cursor, next_cursor = self.get_page(after='STU999')
+
+        self.assertEqual(ids, [f'STU{number:03}' for number in range(16, 26)])
+        self.assertEqual(previous_cursor, 'STU016')
+        self.assertIsNone(next_cursor)
+
+    def test_stale_before_cursor_falls_back_to_first_page(self):
+        ids, previous_cursor, next_cursor = self.get_page(before='STU000')
+
+        self.assertEqual(ids[0], 'STU001')
+        self.assertIsNone(previous_cursor)
+        self.assertEqual(next_cursor, 'STU010')
+
+    def test_cursor_combined_with_search(self):
+        ids, previous_cursor, next_cursor = self.get_page(search='First1', after='STU010')
+
+        self.assertEqual(ids, [f'STU{number:03}' for number in range(11, 20)])
+        self.assertEqual(previous_cursor, 'STU011')
+        self.assertIsNone(next_cursor)
+
+
+class StudentFormEnrollmentTests(TestCase):
+    """Tests for syncing course enrollments when a StudentForm is saved."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.courses = [
+            Course.objects.create(name=f'Course {code}', code=code)
+            for code in ['CS101', 'MA101', 'PH101']
+        ]
+
+    def form_data(self, courses):
+        return {
+            'student_id': 'STU001', 'first_name': 'Ada', 'last_name': 'Lovelace',
+            'email': 'ada@example.com', 'year': '1',
+            'courses': [course.pk for course in courses],
+        }
+
+    def enrolled_codes(self, student):
+        return set(student.courses.values_list('code', flat=True))
+
+    def test_create_enrolls_selected_courses(self):
+        form = StudentForm(self.form_data(self.courses[:2]))
+        self.assertTrue(form.is_valid(), form.errors)
+
+        student = form.save()
+
+        self.assertEqual(self.enrolled_codes(student), {'CS101', 'MA101'})
+
+    def test_update_adds_and_removes_only_the_difference(self):
+        student = StudentForm(self.form_data(self.courses[:2])).save()
+        kept = Enrollment.objects.get(student=student, course=self.courses[1])
+
+        form = StudentForm(self.form_data(self.courses[1:]), instance=student)
+        self.assertTrue(form.is_valid(), form.errors)
+        # Student UPDATE, current enrollments, one INSERT, and the DELETE (which
+        # loads the removed rows first so their post_delete signal can run)
+        with self.assertNumQueries(5):
+            form.save()
+
+        self.assertEqual(self.enrolled_codes(student), {'MA101', 'PH101'})
+        # The unchanged enrollment row is kept, not deleted and re-created
+        self.assertTrue(Enrollment.objects.filter(pk=kept.pk).exists())
+
+    def test_update_can_clear_all_courses(self):
+        student = StudentForm(self.form_data(self.courses)).save()
+
+        form = StudentForm(self.form_data([]), instance=student)
+        self.assertTrue(form.is_valid(), form.errors)
+        form.save()
+
+        self.assertEqual(self.enrolled_codes(student), set())
+
+    def test_commit_false_defers_enrollments_to_save_m2m(self):
+        form = StudentForm(self.form_data(self.courses[:1]))
+        self.assertTrue(form.is_valid(), form.errors)
+
+        student = form.save(commit=False)
+        student.save()
+        self.assertFalse(Enrollment.objects.filter(student=student).exists())
+        form.save_m2m()
+
+        self.assertEqual(self.enrolled_codes(student), {'CS101'})
+
+
+class CourseListCacheTests(TestCase):
+    """Tests for invalidating the cached course table when data changes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('teacher', password='pw')
+        cls.course = Course.objects.create(name='Computer Science', code='CS101')
+        cls.student = Student.objects.create(
+            student_id='STU001', first_name='Ada', last_name='Lovelace',
+            email='ada@example.com', year='1',
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def get_course_list(self):
+        return self.client.get(reverse('course_list')).content.decode()
+
+    def test_new_course_clears_cache(self):
+        self.assertNotIn('MA101', self.get_course_list())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Course.objects.create(name='Mathematics', code='MA101')
+
+        self.assertIn('MA101', self.get_course_list())
+
+    def test_enrollment_changes_clear_cache(self):
+        self.assertIn('0 students', self.get_course_list())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            enrollment = Enrollment.objects.create(student=self.student, course=self.course)
+        self.assertIn('1 student<', self.get_course_list())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            enrollment.delete()
+        self.assertIn('0 students', self.get_course_list())
+
+    def test_cache_is_kept_until_commit(self):
+        self.get_course_list()
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            Course.objects.create(name='Mathematics', code='MA101')
+            self.assertNotIn('MA101', self.get_course_list())
+
+        self.assertEqual(len(callbacks), 1)
+
+    def test_student_update_clears_cache_after_commit(self):
+        self.assertIn('0 students', self.get_course_list())
+        data = {
+            'student_id': 'STU001', 'first_name': 'Ada', 'last_name': 'Lovelace',
+            'email': 'ada@example.com', 'year': '1', 'courses': [self.course.pk],
+        }
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.client.post(reverse('student_edit', args=[self.student.pk]), data)
+            # The cached table survives until the transaction commits
+            self.assertIn('0 students', self.get_course_list())
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertIn('1 student<', self.get_course_list())
+
+    def test_course_list_counts_students_in_one_query(self):
+        Course.objects.create(name='Mathematics', code='MA101')
+        Enrollment.objects.create(student=self.student, course=self.course)
+
+        # Session, user and the annotated course query, whatever the number of courses
+        with self.assertNumQueries(3):
+            content = self.get_course_list()
+
+        self.assertIn('1 student<', content)
+        self.assertIn('0 students', content)
+
+
+class GradeModelTests(TestCase):
+    """Tests for the Grade model."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = Student.objects.create(
+            student_id='STU001', first_name='Ada', last_name='Lovelace',
+            email='ada@example.com', year='1',
+        )
+        cls.course = Course.objects.create(name='Computer Science', code='CS101')
+
+    def test_str_of_unsaved_grade_leaves_out_letter(self):
+        grade = Grade(student_id=self.student.pk, course_id=self.course.pk, marks=90)
+
+        self.assertEqual(str(grade), f'Student #{self.student.pk} - Course #{self.course.pk} - ?')
+        self.assertIn('?', repr(grade))
+
+    def test_str_of_saved_grade_shows_letter(self):
+        Grade.objects.create(student=self.student, course=self.course, marks=90)
+
+        grade = Grade.objects.select_related('student', 'course').get()
+
+        self.assertEqual(str(grade), 'Ada Lovelace - Computer Science - A')
+
+    def test_form_reports_out_of_range_marks_on_marks_field(self):
+        form = GradeForm({'student': self.student.pk, 'course': self.course.pk, 'marks': 150})
+
+        self.assertFalse(form.is_valid())
+        self.assertIn('marks', form.errors)
+        self.assertEqual(form.non_field_errors(), [])
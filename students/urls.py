@@ -21,4 +21,5 @@ urlpatterns = [
     
     # Grade URLs
     path('grades/add/', views.grade_create, name='grade_add'),
+    path('grades/import/', views.grade_bulk_create, name='grade_import'),
 ]
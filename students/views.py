@@ -2,9 +2,13 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
 from django.contrib.auth import login
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import Paginator
-from .models import Student, Course, Grade
-from .forms import StudentForm, CourseForm, GradeForm, UserRegisterForm
+from django.db import connection, transaction
+from django.db.models import Avg, Count, IntegerField, OuterRef, Prefetch, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
+from .models import Student, Course, Enrollment, Grade
+from .forms import StudentForm, CourseForm, GradeForm, GradeImportForm, UserRegisterForm
 
 
 # Authentication Views
@@ -30,18 +34,35 @@ def register(request):
 
 
 # Dashboard
+def _dashboard_counts():
+    """
+    Return (students, courses, grades) row counts in a single database round trip.
+    Uses scalar subqueries since the ORM can only count one table per query.
+    """
+    tables = [connection.ops.quote_name(model._meta.db_table) for model in (Student, Course, Grade)]
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT ' + ', '.join(f'(SELECT COUNT(*) FROM {table})' for table in tables))
+        return cursor.fetchone()
+
+
 @login_required  # Ensures only authenticated users can access dashboard
+@cache_page(30)  # Serve the rendered dashboard from cache for 30 seconds
+@vary_on_cookie  # Cache per session since the page shows the logged-in user
 def dashboard(request):
     """
     Display system overview with statistics and recent activity.
     Shows total counts and recently added students.
     """
     # Calculate statistics for dashboard display
+    total_students, total_courses, total_grades = _dashboard_counts()
     context = {
-        'total_students': Student.objects.count(),
-        'total_courses': Course.objects.count(),
-        'total_grades': Grade.objects.count(),
-        'recent_students': Student.objects.order_by('-created_at')[:5]  # Last 5 students added
+        'total_students': total_students,
+        'total_courses': total_courses,
+        'total_grades': total_grades,
+        # Last 5 students added - only the columns the dashboard displays
+        'recent_students': Student.objects.only(
+            'student_id', 'first_name', 'last_name', 'created_at'
+        ).order_by('-created_at')[:5]
     }
     return render(request, 'students/dashboard.html', context)
 
@@ -50,6 +71,7 @@ def dashboard(request):
 
 # CREATE - Add new student
 @login_required
+@transaction.atomic  # Run all writes for this request in one transaction
 def student_create(request):
     """
     Handle both GET and POST requests for creating new students.
@@ -73,33 +95,82 @@ def student_create(request):
 
 
 # READ - List all students
+STUDENTS_PER_PAGE = 10
+
+
+def _keyset_page(queryset, after=None, before=None, per_page=STUDENTS_PER_PAGE):
+    """
+    Return (items, has_previous, has_next) for one page of students ordered by
+    student_id, starting after/before the given student_id cursor.
+    Seeks through the unique index instead of running COUNT(*) and OFFSET.
+    A stale cursor that would give an empty page (e.g. rows deleted since the
+    link was rendered) falls back to the nearest non-empty page.
+    """
+    if after:
+        # Fetch one extra row to find out whether a next page exists
+        rows = list(queryset.filter(student_id__gt=after).order_by('student_id')[:per_page + 1])
+        if rows:
+            return rows[:per_page], True, len(rows) > per_page
+        # Nothing past the cursor any more - show the last page instead
+        rows = list(queryset.filter(student_id__lte=after).order_by('-student_id')[:per_page + 1])
+        return rows[:per_page][::-1], len(rows) > per_page, False
+    if before:
+        # Walk backwards from the cursor, then restore ascending order
+        rows = list(queryset.filter(student_id__lt=before).order_by('-student_id')[:per_page + 1])
+        if rows:
+            return rows[:per_page][::-1], len(rows) > per_page, True
+        # Nothing before the cursor any more - show the first page instead
+    rows = list(queryset.order_by('student_id')[:per_page + 1])
+    return rows[:per_page], False, len(rows) > per_page
+
+
 @login_required
 def student_list(request):
     """
     Display paginated list of students with search functionality.
-    Implements search across multiple fields and pagination for performance.
+    Implements search across multiple fields and cursor (keyset) pagination,
+    so no page needs a COUNT(*) of the whole table.
     """
-    # Start with all students ordered by student ID
-    student_list = Student.objects.all().order_by('student_id')
+    # Start with all students (Meta.ordering sorts by student ID),
+    # loading only the columns the list template displays
+    student_list = Student.objects.only('student_id', 'first_name', 'last_name', 'email', 'year')
+    
+    # Per-student course count and average marks as correlated subqueries, so a
+    # page is one query (no per-row COUNT, no row fan-out from joining both tables)
+    enrollments = Enrollment.objects.filter(student=OuterRef('pk')).order_by().values('student')
+    grades = Grade.objects.filter(student=OuterRef('pk')).order_by().values('student')
+    student_list = student_list.annotate(
+        course_count=Coalesce(
+            Subquery(enrollments.annotate(count=Count('pk')).values('count')),
+            0,
+            output_field=IntegerField(),
+        ),
+        avg_marks=Subquery(grades.annotate(avg=Avg('marks')).values('avg')),
+    )
     
     # Search functionality - filter by name or student ID
     search = request.GET.get('search')
     if search:
-        # Search across multiple fields using case-insensitive matching
+        # Search across multiple fields in a single query using OR-ed Q objects
         student_list = student_list.filter(
-            first_name__icontains=search
-        ) or student_list.filter(
-            last_name__icontains=search
-        ) or student_list.filter(
-            student_id__icontains=search
+            Q(first_name__icontains=search) |
+            Q(last_name__icontains=search) |
+            Q(student_id__icontains=search)
         )
     
-    # Pagination - limit to 10 students per page for better performance
-    paginator = Paginator(student_list, 10)  # 10 students per page
-    page_number = request.GET.get('page')
-    students = paginator.get_page(page_number)
+    # Pagination - 10 students per page, continuing from the ?after= / ?before= cursor
+    students, has_previous, has_next = _keyset_page(
+        student_list,
+        after=request.GET.get('after'),
+        before=request.GET.get('before'),
+    )
     
-    return render(request, 'students/student_list.html', {'students': students})
+    # Cursors for the Previous/Next links (only meaningful on a non-empty page)
+    return render(request, 'students/student_list.html', {
+        'students': students,
+        'previous_cursor': students[0].student_id if students and has_previous else None,
+        'next_cursor': students[-1].student_id if students and has_next else None,
+    })
 
 
 # READ - Student detail view
@@ -109,10 +180,17 @@ def student_detail(request, pk):
     Display detailed information for a specific student including grades.
     Uses get_object_or_404 for proper error handling.
     """
-    # Get student or return 404 if not found
-    student = get_object_or_404(Student, pk=pk)
-    # Get all grades for this student
-    grades = Grade.objects.filter(student=student)
+    # Get student or return 404 if not found, prefetching grades (with their
+    # course) and enrolled courses so the template doesn't query per row
+    student = get_object_or_404(
+        Student.objects.prefetch_related(
+            Prefetch('grades', queryset=Grade.objects.select_related('course')),
+            'courses',
+        ),
+        pk=pk
+    )
+    # Get all grades for this student (served from the prefetch cache)
+    grades = student.grades.all()
     return render(request, 'students/student_detail.html', {
         'student': student,
         'grades': grades
@@ -121,6 +199,7 @@ def student_detail(request, pk):
 
 # UPDATE - Edit student
 @login_required
+@transaction.atomic  # Run all writes for this request in one transaction
 def student_update(request, pk):
     """
     Handle student information updates.
@@ -158,7 +237,10 @@ def student_delete(request, pk):
     
     if request.method == 'POST':
         # User confirmed deletion - proceed with removal
-        student.delete()  # This also deletes related grades due to CASCADE
+        # CASCADE also removes the student's grades and enrollments. Grades are
+        # fast-deleted (one DELETE, nothing loaded first); enrollments are loaded
+        # first so their post_delete signal clears the cached course table.
+        student.delete()
         messages.success(request, 'Student deleted successfully!')
         return redirect('student_list')
     
@@ -172,8 +254,11 @@ def course_list(request):
     """
     Display list of all available courses.
     Simple view showing all courses without pagination.
+    The course table is fragment-cached in the template, so the lazy queryset
+    below is only evaluated on a cache miss.
     """
-    courses = Course.objects.all()  # Get all courses
+    # Get all courses with their enrollment counts in a single query
+    courses = Course.objects.only('code', 'name', 'credits').annotate(student_count=Count('enrollment'))
     return render(request, 'students/course_list.html', {'courses': courses})
 
 
@@ -199,6 +284,7 @@ def course_create(request):
 
 # GRADE OPERATIONS
 @login_required
+@transaction.atomic  # Run all writes for this request in one transaction
 def grade_create(request):
     """
     Handle grade assignment linking students to courses with performance data.
@@ -216,3 +302,55 @@ def grade_create(request):
         form = GradeForm()
     
     return render(request, 'students/grade_form.html', {'form': form})
+
+
+@login_required
+def grade_bulk_create(request):
+    """
+    Import many grades at once from an uploaded CSV file.
+    Resolves students and courses with two lookups, drops rows for grades that
+    already exist (or repeat in the file) and inserts the rest in one batched INSERT.
+    """
+    if request.method == 'POST':
+        form = GradeImportForm(request.POST, request.FILES)
+        if form.is_valid():
+            rows = form.cleaned_data['csv_file']
+            # Resolve foreign keys in bulk instead of one query per row
+            students = Student.objects.in_bulk({row[0] for row in rows}, field_name='student_id')
+            courses = Course.objects.in_bulk({row[1] for row in rows}, field_name='code')
+            # Student-course pairs that already have a grade, in a single query
+            taken = set(
+                Grade.objects.filter(
+                    student__in=students.values(), course__in=courses.values()
+                ).values_list('student_id', 'course_id')
+            )
+            
+            grades = []
+            unknown = 0
+            duplicates = 0
+            for student_id, course_code, marks in rows:
+                if student_id not in students or course_code not in courses:
+                    unknown += 1
+                    continue
+                pair = (students[student_id].pk, courses[course_code].pk)
+                if pair in taken:
+                    duplicates += 1  # Existing grade, or repeated earlier in the file
+                    continue
+                taken.add(pair)
+                grades.append(Grade(student_id=pair[0], course_id=pair[1], marks=marks))
+            
+            with transaction.atomic():
+                # ignore_conflicts still guards against grades added concurrently
+                Grade.objects.bulk_create(grades, batch_size=500, ignore_conflicts=True)
+            
+            messages.success(request, f'Imported {len(grades)} grade(s).')
+            if unknown:
+                messages.warning(request, f'Skipped {unknown} row(s) with an unknown student ID or course code.')
+            if duplicates:
+                messages.warning(request, f'Skipped {duplicates} row(s) for grades that already exist or repeat in the file.')
+            return redirect('student_list')
+    else:
+        # GET request - show empty upload form
+        form = GradeImportForm()
+    
+    return render(request, 'students/grade_import_form.html', {'form': form})